@@ -51,6 +51,7 @@ from .devices import (
 # Import utility functions
 from .utils import (
     resample_audio,
+    StreamingResampler,
     convert_to_mono,
     calculate_audio_duration,
 )
@@ -89,6 +90,7 @@ __all__ = [
     "find_virtual_mic_device",
     # Utility functions
     "resample_audio",
+    "StreamingResampler",
     "convert_to_mono",
     "calculate_audio_duration",
 ]
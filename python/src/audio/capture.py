@@ -77,6 +77,9 @@ class BaseCaptureDevice:
     Uses callback mode for minimal latency and async queues for integration.
     """
 
+    # Bound on buffered chunks (~1s at 16kHz/1024 frames); oldest dropped first
+    QUEUE_MAXSIZE: int = 16
+
     def __init__(
         self,
         sample_rate: int,
@@ -102,8 +105,11 @@ class BaseCaptureDevice:
         self._stream: Optional[pyaudio.Stream] = None
         self._state = CaptureState.STOPPED
 
-        # Async queue for audio chunks
-        self._queue: asyncio.Queue[AudioChunk] = asyncio.Queue(maxsize=100)
+        # Async queue for audio chunks, fed from the PortAudio thread via
+        # call_soon_threadsafe (asyncio.Queue is not thread-safe)
+        self._queue: asyncio.Queue[AudioChunk] = asyncio.Queue(
+            maxsize=self.QUEUE_MAXSIZE
+        )
 
         # Optional callback for each audio chunk
         self._on_data: Optional[Callable[[AudioChunk], Awaitable[None]]] = None
@@ -152,7 +158,8 @@ class BaseCaptureDevice:
         PyAudio callback executed in separate thread.
 
         This is called by PyAudio for each audio buffer. We need to be fast here
-        to avoid audio glitches. We push data to an async queue for processing.
+        to avoid audio glitches. The chunk is handed to the event loop thread,
+        which pushes it onto the async queue.
 
         Args:
             in_data: Audio data as bytes
@@ -182,22 +189,36 @@ class BaseCaptureDevice:
             self._chunks_captured += 1
             self._bytes_captured += len(in_data)
 
-            # Try to put in queue without blocking
-            try:
-                self._queue.put_nowait(chunk)
-            except asyncio.QueueFull:
-                self._overruns += 1
-                logger.warning("Audio queue full, dropping chunk")
+            if self._loop:
+                # Hand off to the event loop thread without blocking
+                self._loop.call_soon_threadsafe(self._enqueue_chunk, chunk)
 
-            # Schedule callback if registered
-            if self._on_data and self._loop:
-                asyncio.run_coroutine_threadsafe(self._on_data(chunk), self._loop)
+                # Schedule callback if registered
+                if self._on_data:
+                    asyncio.run_coroutine_threadsafe(self._on_data(chunk), self._loop)
 
         except Exception as e:
             logger.error(f"Error in audio callback: {e}")
 
         return (None, pyaudio.paContinue)
 
+    def _enqueue_chunk(self, chunk: AudioChunk) -> None:
+        """
+        Push a chunk onto the queue, dropping the oldest one if full.
+
+        Runs on the event loop thread (scheduled from the PyAudio callback).
+
+        Args:
+            chunk: Captured audio chunk
+        """
+        try:
+            self._queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(chunk)
+            self._overruns += 1
+            logger.warning("Audio queue full, dropped oldest chunk")
+
     async def start(
         self, on_data: Optional[Callable[[AudioChunk], Awaitable[None]]] = None
     ) -> None:
@@ -464,14 +485,14 @@ class SystemAudioCapture(BaseCaptureDevice):
         """
         # Convert stereo to mono if needed
         if self._stereo_to_mono and self._input_channels == 2:
-            # Convert bytes to int16 array
-            audio_array = np.frombuffer(in_data, dtype=np.int16)
-
-            # Reshape to (frames, channels)
-            audio_array = audio_array.reshape(-1, 2)
-
-            # Average channels to get mono
-            mono_array = audio_array.mean(axis=1).astype(np.int16)
+            # Interpret bytes as (frames, channels) int16 samples
+            audio_array = np.frombuffer(in_data, dtype=np.int16).reshape(-1, 2)
+
+            # Average channels in integer arithmetic (no float64 round-trip);
+            # int32 avoids overflow and the shift floors the half-sum
+            mono_array = (
+                (audio_array[:, 0].astype(np.int32) + audio_array[:, 1]) >> 1
+            ).astype(np.int16)
 
             # Convert back to bytes
             in_data = mono_array.tobytes()
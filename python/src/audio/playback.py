@@ -104,8 +104,11 @@ class BasePlaybackDevice:
         self._underruns = 0
 
         # Silence buffer for underruns
-        bytes_per_chunk = chunk_size * channels * (BIT_DEPTH // 8)
-        self._silence = bytes(bytes_per_chunk)
+        self._frame_bytes = channels * (BIT_DEPTH // 8)
+        self._silence = bytes(chunk_size * self._frame_bytes)
+
+        # Carry-over of queued audio not yet handed to PortAudio
+        self._pending = bytearray()
 
         # Pre-buffer with silence chunks for clean start (2-3 chunks)
         self._prebuffer_size = 2
@@ -148,6 +151,10 @@ class BasePlaybackDevice:
         This is called by PyAudio when it needs more audio data to play.
         We need to return data quickly to avoid audio glitches.
 
+        Always returns exactly frame_count frames: queued chunks are
+        concatenated (or split) through a small carry-over buffer, so writes
+        of any size play back gaplessly. A short read is padded with silence.
+
         CRITICAL: This runs in a separate thread, so we use queue.Queue.get_nowait()
         which is thread-safe, NOT asyncio.Queue.
 
@@ -165,20 +172,37 @@ class BasePlaybackDevice:
             self._underruns += 1
             logger.warning("Audio output underflow detected (buffer underrun)")
 
+        nbytes = frame_count * self._frame_bytes
+        silence = self._silence if nbytes == len(self._silence) else bytes(nbytes)
+        pending = self._pending
+
         try:
-            # Try to get audio from queue without blocking
-            try:
-                audio_data = self._queue.get_nowait()
+            # Pull queued chunks without blocking until the request is covered
+            while len(pending) < nbytes:
+                try:
+                    audio_data = self._queue.get_nowait()
+                except queue.Empty:
+                    break
                 self._chunks_played += 1
                 self._bytes_played += len(audio_data)
-            except queue.Empty:
-                # No data available, play silence
-                audio_data = self._silence
+
+                # Fast path: a whole, exactly-sized chunk is returned as-is
+                if not pending and len(audio_data) == nbytes:
+                    return (audio_data, pyaudio.paContinue)
+                pending += audio_data
+
+            if len(pending) >= nbytes:
+                audio_data = bytes(pending[:nbytes])
+                del pending[:nbytes]
+            else:
+                # Not enough data available, pad with silence
+                audio_data = bytes(pending) + silence[len(pending) :]
+                pending.clear()
                 self._underruns += 1
 
         except Exception as e:
             logger.error(f"Error in playback callback: {e}")
-            audio_data = self._silence
+            audio_data = silence
 
         return (audio_data, pyaudio.paContinue)
 
@@ -302,7 +326,8 @@ class BasePlaybackDevice:
                 self._pyaudio.terminate()
                 self._pyaudio = None
 
-            # Clear the queue
+            # Clear the queue and any carry-over
+            self._pending.clear()
             while not self._queue.empty():
                 try:
                     self._queue.get_nowait()
@@ -316,7 +341,9 @@ class BasePlaybackDevice:
         """
         Write audio data to playback queue (async version).
 
-        Uses run_in_executor to wrap the blocking queue.put() call.
+        The chunk is enqueued directly (no copy) when the queue has room. Only
+        when the queue is full is the blocking queue.put() wrapped in
+        run_in_executor, so the common case avoids a thread-pool round trip.
 
         Args:
             audio_data: Raw PCM audio bytes to play
@@ -329,6 +356,12 @@ class BasePlaybackDevice:
         if self._state != PlaybackState.RUNNING:
             raise PlaybackStreamError("Cannot write: playback is not running")
 
+        try:
+            self._queue.put_nowait(audio_data)
+            return
+        except queue.Full:
+            pass
+
         loop = asyncio.get_running_loop()
 
         # Wrap blocking queue.put() in executor
@@ -9,6 +9,11 @@ from typing import Optional
 import numpy as np
 from scipy import signal
 
+try:
+    import soxr
+except ImportError:  # Optional: falls back to per-chunk scipy resampling
+    soxr = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,29 +70,102 @@ def resample_audio(
         # Mono: direct resampling
         resampled = signal.resample(audio_array, target_samples)
     else:
-        # Multi-channel: resample each channel separately
+        # Multi-channel: resample all channels in one pass along the frame
+        # axis, then flatten back to interleaved order
         audio_array = audio_array.reshape(-1, channels)
-        resampled_channels = []
-        for ch in range(channels):
-            channel_data = audio_array[:, ch]
-            resampled_channel = signal.resample(channel_data, target_samples)
-            resampled_channels.append(resampled_channel)
-
-        # Interleave channels back
-        resampled = np.column_stack(resampled_channels).flatten()
+        resampled = signal.resample(audio_array, target_samples, axis=0).reshape(-1)
 
-    # Convert back to original dtype and bytes
-    resampled = np.clip(resampled, np.iinfo(dtype).min, np.iinfo(dtype).max)
+    # Clip in place, then convert back to original dtype and bytes
+    np.clip(resampled, np.iinfo(dtype).min, np.iinfo(dtype).max, out=resampled)
     resampled = resampled.astype(dtype)
 
     logger.debug(
-        f"Resampled audio: {original_rate}Hz -> {target_rate}Hz "
-        f"({len(audio_data)} bytes -> {len(resampled.tobytes())} bytes)"
+        "Resampled audio: %dHz -> %dHz (%d bytes -> %d bytes)",
+        original_rate,
+        target_rate,
+        len(audio_data),
+        resampled.nbytes,
     )
 
     return resampled.tobytes()
 
 
+class StreamingResampler:
+    """
+    Stateful resampler for continuous 16-bit PCM streams.
+
+    Keeps filter state across chunks so consecutive chunks are resampled as
+    one continuous signal, without per-call setup. Uses libsoxr when the
+    optional ``soxr`` package is installed, otherwise falls back to
+    resample_audio() on each chunk.
+
+    Example:
+        ```python
+        resampler = StreamingResampler(24000, 16000)
+        for chunk in chunks:
+            audio_16k = resampler.resample_chunk(chunk)
+        resampler.reset()  # Before starting an unrelated stream
+        ```
+    """
+
+    def __init__(
+        self,
+        original_rate: int,
+        target_rate: int,
+        channels: int = 1,
+        quality: str = "QQ",
+    ):
+        """
+        Initialize streaming resampler.
+
+        Args:
+            original_rate: Original sample rate in Hz
+            target_rate: Target sample rate in Hz
+            channels: Number of audio channels (interleaved)
+            quality: soxr quality preset ("QQ", "LQ", "MQ", "HQ", "VHQ")
+        """
+        self._original_rate = original_rate
+        self._target_rate = target_rate
+        self._channels = channels
+        self._stream = None
+
+        if soxr is not None and original_rate != target_rate:
+            self._stream = soxr.ResampleStream(
+                original_rate, target_rate, channels, dtype="int16", quality=quality
+            )
+
+    def resample_chunk(self, audio_data: bytes) -> bytes:
+        """
+        Resample the next chunk of the stream.
+
+        Args:
+            audio_data: Raw 16-bit PCM audio bytes
+
+        Returns:
+            Resampled audio data as bytes
+        """
+        if self._original_rate == self._target_rate:
+            return audio_data
+
+        if self._stream is None:
+            return resample_audio(
+                audio_data,
+                self._original_rate,
+                self._target_rate,
+                channels=self._channels,
+            )
+
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        if self._channels > 1:
+            samples = samples.reshape(-1, self._channels)
+        return self._stream.resample_chunk(samples).tobytes()
+
+    def reset(self) -> None:
+        """Discard buffered filter state before resampling a new stream."""
+        if self._stream is not None:
+            self._stream.clear()
+
+
 def convert_to_mono(audio_data: bytes, bit_depth: int = 16) -> bytes:
     """
     Convert stereo audio to mono by averaging channels.
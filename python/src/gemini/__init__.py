@@ -28,6 +28,9 @@ from .client import (
     GeminiStats,
 )
 
+# Import client pool
+from .pool import GeminiClientPool
+
 # Import error classes
 from .errors import (
     GeminiError,
@@ -55,6 +58,7 @@ __all__ = [
     "GeminiS2STClient",
     "ConnectionState",
     "GeminiStats",
+    "GeminiClientPool",
     # Errors
     "GeminiError",
     "GeminiConnectionError",
@@ -7,7 +7,6 @@ Google's Gemini Live API with native audio support.
 
 import asyncio
 import logging
-import os
 from typing import Optional, AsyncGenerator
 from enum import Enum, auto
 from dataclasses import dataclass
@@ -15,7 +14,7 @@ from dataclasses import dataclass
 from google import genai
 from google.genai import types
 
-from .config import GeminiConfig, SupportedLanguage
+from .config import GeminiConfig, SupportedLanguage, _get_gcp_project_env
 from .errors import (
     GeminiConnectionError,
     GeminiAuthenticationError,
@@ -128,7 +127,7 @@ class GeminiS2STClient:
         self._enable_auto_reconnect = enable_auto_reconnect
 
         # Vertex AI configuration
-        self._gcp_project = config.gcp_project or os.environ.get("GOOGLE_CLOUD_PROJECT")
+        self._gcp_project = config.gcp_project or _get_gcp_project_env()
         self._gcp_location = config.gcp_location
 
         if not self._gcp_project:
@@ -169,6 +168,11 @@ class GeminiS2STClient:
         """Get current connection state."""
         return self._state
 
+    @property
+    def config(self) -> GeminiConfig:
+        """Get the configuration this client was created with."""
+        return self._config
+
     @property
     def stats(self) -> dict:
         """
@@ -330,10 +334,13 @@ class GeminiS2STClient:
 
         logger.info("Disconnected from Gemini API")
 
-    async def send_audio(self, audio_chunk: bytes) -> None:
+    async def send_audio(self, audio_chunk: bytes | bytearray | memoryview) -> None:
         """
         Send audio chunk to Gemini API for translation.
 
+        Accepts any bytes-like buffer so callers can pass views of reusable
+        buffers; it is materialized as bytes only once, for the SDK Blob.
+
         Args:
             audio_chunk: Raw PCM audio bytes (16-bit, 16kHz, mono)
 
@@ -345,6 +352,10 @@ class GeminiS2STClient:
             raise GeminiConnectionError("Not connected to Gemini API")
 
         try:
+            # Blob validation rejects memoryview; copy it out exactly once
+            if isinstance(audio_chunk, memoryview):
+                audio_chunk = audio_chunk.tobytes()
+
             # Create audio blob
             audio_blob = types.Blob(
                 data=audio_chunk, mime_type=self.INPUT_MIME_TYPE
@@ -359,7 +370,7 @@ class GeminiS2STClient:
 
         except Exception as e:
             self._stats.error_count += 1
-            logger.error(f"Failed to send audio: {e}")
+            logger.error("Failed to send audio: %s", e)
 
             # Check for session expiry
             if "session" in str(e).lower() and "expired" in str(e).lower():
@@ -405,7 +416,7 @@ class GeminiS2STClient:
             logger.debug("Receive loop cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in receive loop: {e}")
+            logger.error("Error in receive loop: %s", e)
             self._state = ConnectionState.ERROR
             self._stats.error_count += 1
 
@@ -434,21 +445,68 @@ class GeminiS2STClient:
                 yield audio_chunk
 
             except asyncio.TimeoutError:
-                # Check if session should be reconnected
-                if self._timeout_tracker.should_reconnect():
-                    logger.warning("Session timeout approaching, reconnecting...")
-                    if self._enable_auto_reconnect:
-                        await self._reconnect()
-                    else:
-                        raise GeminiSessionExpiredError(
-                            "Session timeout approaching and auto-reconnect disabled"
-                        )
+                await self._check_session_timeout()
                 continue
 
             except Exception as e:
-                logger.error(f"Error receiving audio: {e}")
+                logger.error("Error receiving audio: %s", e)
                 break
 
+    async def receive_audio_batch(self, max_chunks: int = 8) -> list[bytes]:
+        """
+        Receive all pending translated audio chunks in a single await.
+
+        Waits for at least one chunk, then drains up to max_chunks that are
+        already queued without suspending again.
+
+        Args:
+            max_chunks: Maximum number of chunks to return
+
+        Returns:
+            List of audio chunks (16-bit PCM, 24kHz, mono); empty once the
+            client is no longer connected
+
+        Example:
+            ```python
+            while chunks := await client.receive_audio_batch():
+                for audio_chunk in chunks:
+                    await speaker.write_chunk(audio_chunk)
+            ```
+        """
+        if not self.is_connected:
+            raise GeminiConnectionError("Not connected to Gemini API")
+
+        receive_queue = self._receive_queue
+        while self.is_connected:
+            try:
+                first = await asyncio.wait_for(receive_queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                await self._check_session_timeout()
+                continue
+
+            chunks = [first]
+            while len(chunks) < max_chunks and not receive_queue.empty():
+                chunks.append(receive_queue.get_nowait())
+            return chunks
+
+        return []
+
+    async def _check_session_timeout(self) -> None:
+        """
+        Reconnect if the session is approaching its timeout.
+
+        Raises:
+            GeminiSessionExpiredError: If timeout is near and auto-reconnect is off
+        """
+        if self._timeout_tracker.should_reconnect():
+            logger.warning("Session timeout approaching, reconnecting...")
+            if self._enable_auto_reconnect:
+                await self._reconnect()
+            else:
+                raise GeminiSessionExpiredError(
+                    "Session timeout approaching and auto-reconnect disabled"
+                )
+
     async def _reconnect(self) -> None:
         """
         Internal method to handle reconnection with backoff.
@@ -484,6 +542,19 @@ class GeminiS2STClient:
         self._input_transcription.clear()
         self._output_transcription.clear()
 
+    def clear_receive_queue(self) -> int:
+        """
+        Discard translated audio that has not been consumed yet.
+
+        Returns:
+            Number of chunks discarded
+        """
+        discarded = 0
+        while not self._receive_queue.empty():
+            self._receive_queue.get_nowait()
+            discarded += 1
+        return discarded
+
     # Context manager support
     async def __aenter__(self) -> "GeminiS2STClient":
         """Async context manager entry."""
@@ -8,17 +8,20 @@ speech-to-speech translation.
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from .errors import GeminiConfigurationError
 
 
-class SupportedLanguage(Enum):
+class SupportedLanguage(str, Enum):
     """
     Supported languages for Gemini S2ST translation.
 
     Each enum value represents a BCP-47 language code supported by
-    the Gemini Live API for speech-to-speech translation.
+    the Gemini Live API for speech-to-speech translation. Members are
+    ``str`` instances equal to their code and format as it, so they can be
+    passed wherever a language code string is expected.
     """
 
     # Major languages (short codes as required by Gemini Live API)
@@ -65,10 +68,14 @@ class SupportedLanguage(Enum):
     GREEK = "el"
     UKRAINIAN = "uk"
 
+    # Format as the code itself (str + Enum prints the member name on 3.11+)
+    __str__ = str.__str__
+    __format__ = str.__format__
+
     @property
     def display_name(self) -> str:
         """Get human-readable display name for the language."""
-        return _LANGUAGE_DISPLAY_NAMES.get(self, self.value)
+        return self._display_name
 
     @property
     def language_code(self) -> str:
@@ -96,7 +103,7 @@ class SupportedLanguage(Enum):
             if lang.value == code:
                 return lang
         # Try matching the prefix of a BCP-47 code (e.g., "ja-JP" -> "ja")
-        short = code.split("-")[0]
+        short = code.partition("-")[0]
         for lang in cls:
             if lang.value == short:
                 return lang
@@ -146,6 +153,49 @@ _LANGUAGE_DISPLAY_NAMES = {
     SupportedLanguage.UKRAINIAN: "Ukrainian",
 }
 
+# Bind display names directly onto each member so the property is a plain
+# attribute load rather than a dict lookup
+for _lang in SupportedLanguage:
+    _lang._display_name = _LANGUAGE_DISPLAY_NAMES.get(_lang, _lang.value)
+del _lang
+
+# Static lookup tables, built once at import (the enum never changes)
+_ALL_LANGUAGES: tuple[SupportedLanguage, ...] = tuple(SupportedLanguage)
+_LANGUAGE_CHOICES: dict[str, SupportedLanguage] = {
+    lang.display_name: lang for lang in _ALL_LANGUAGES
+}
+
+
+@lru_cache(maxsize=1)
+def _get_gemini_model_env() -> str:
+    """
+    Resolve GEMINI_MODEL from the environment (cached).
+
+    The environment is treated as static for the life of the process, so the
+    value is read once. Call ``_get_gemini_model_env.cache_clear()`` after
+    changing the environment (e.g., in tests).
+
+    Raises:
+        GeminiConfigurationError: If GEMINI_MODEL is not set.
+    """
+    model = os.environ.get("GEMINI_MODEL")
+    if not model:
+        raise GeminiConfigurationError(
+            "GEMINI_MODEL environment variable is not set. "
+            "Set it in your .env file."
+        )
+    return model
+
+
+@lru_cache(maxsize=1)
+def _get_gcp_project_env() -> Optional[str]:
+    """
+    Resolve GOOGLE_CLOUD_PROJECT from the environment (cached).
+
+    Call ``_get_gcp_project_env.cache_clear()`` after changing the environment.
+    """
+    return os.environ.get("GOOGLE_CLOUD_PROJECT")
+
 
 @dataclass(frozen=True)
 class GeminiConfig:
@@ -164,14 +214,19 @@ class GeminiConfig:
     enable_transcription: bool = False
     voice_name: Optional[str] = None
     system_instruction: Optional[str] = None
+    jitter_buffer_chunks: int = 5  # Received chunks buffered before output drops oldest
 
     # Vertex AI configuration
     gcp_project: Optional[str] = None  # Defaults to GOOGLE_CLOUD_PROJECT env var
     gcp_location: str = "us-central1"  # Vertex AI region
 
     def __post_init__(self) -> None:
-        """Validate configuration parameters."""
-        if not isinstance(self.target_language, SupportedLanguage):
+        """
+        Validate configuration parameters.
+
+        The target_language type check is skipped under ``python -O``.
+        """
+        if __debug__ and not isinstance(self.target_language, SupportedLanguage):
             raise ValueError(
                 f"target_language must be a SupportedLanguage enum value, "
                 f"got {type(self.target_language)}"
@@ -180,6 +235,10 @@ class GeminiConfig:
             raise GeminiConfigurationError(
                 "model is required. Use GeminiConfig.from_env() or pass model explicitly."
             )
+        if self.jitter_buffer_chunks < 1:
+            raise GeminiConfigurationError(
+                f"jitter_buffer_chunks must be at least 1, got {self.jitter_buffer_chunks}"
+            )
 
     @classmethod
     def from_env(cls, **kwargs) -> "GeminiConfig":
@@ -189,13 +248,7 @@ class GeminiConfig:
         Raises:
             GeminiConfigurationError: If GEMINI_MODEL is not set.
         """
-        model = os.environ.get("GEMINI_MODEL")
-        if not model:
-            raise GeminiConfigurationError(
-                "GEMINI_MODEL environment variable is not set. "
-                "Set it in your .env file."
-            )
-        return cls(model=model, **kwargs)
+        return cls(model=_get_gemini_model_env(), **kwargs)
 
     @property
     def language_code(self) -> str:
@@ -215,7 +268,7 @@ def get_all_languages() -> list[SupportedLanguage]:
     Returns:
         List of all SupportedLanguage enum values
     """
-    return list(SupportedLanguage)
+    return list(_ALL_LANGUAGES)
 
 
 def get_language_choices() -> dict[str, SupportedLanguage]:
@@ -234,7 +287,7 @@ def get_language_choices() -> dict[str, SupportedLanguage]:
             print(f"{name}: {lang.language_code}")
         ```
     """
-    return {lang.display_name: lang for lang in SupportedLanguage}
+    return dict(_LANGUAGE_CHOICES)
 
 
 def get_language_by_name(name: str) -> SupportedLanguage | None:
@@ -7,6 +7,7 @@ Custom exceptions and reconnection logic for Gemini Live API integration.
 import asyncio
 import logging
 import random
+import time
 from typing import Callable, Awaitable, Optional
 from enum import Enum, auto
 
@@ -64,6 +65,13 @@ class ReconnectionState(Enum):
     FAILED = auto()
 
 
+def _build_delay_schedule(
+    base_delay: float, multiplier: float, max_delay: float, retries: int
+) -> tuple[float, ...]:
+    """Precompute capped exponential backoff delays for each retry index."""
+    return tuple(min(base_delay * multiplier**i, max_delay) for i in range(retries))
+
+
 class ReconnectionHandler:
     """
     Handles automatic reconnection with exponential backoff.
@@ -78,6 +86,21 @@ class ReconnectionHandler:
     MAX_DELAY: float = 30.0  # seconds
     BACKOFF_MULTIPLIER: float = 2.0
 
+    # Errors considered transient and worth retrying with backoff
+    _TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+        GeminiConnectionError,
+        GeminiAudioError,
+        GeminiRateLimitError,
+        GeminiSessionExpiredError,
+        asyncio.TimeoutError,
+        OSError,
+    )
+
+    # Backoff schedule for the default retry count (before jitter)
+    _DELAYS: tuple[float, ...] = _build_delay_schedule(
+        BASE_DELAY, BACKOFF_MULTIPLIER, MAX_DELAY, MAX_RETRIES
+    )
+
     def __init__(self, max_retries: int = MAX_RETRIES):
         """
         Initialize reconnection handler.
@@ -88,6 +111,13 @@ class ReconnectionHandler:
         self._max_retries = max_retries
         self._retry_count = 0
         self._state = ReconnectionState.IDLE
+        self._delays = (
+            self._DELAYS
+            if max_retries == self.MAX_RETRIES
+            else _build_delay_schedule(
+                self.BASE_DELAY, self.BACKOFF_MULTIPLIER, self.MAX_DELAY, max_retries
+            )
+        )
 
     def reset(self) -> None:
         """Reset reconnection state and retry counter."""
@@ -114,13 +144,8 @@ class ReconnectionHandler:
         Returns:
             Delay in seconds for next retry attempt
         """
-        # Calculate base exponential backoff
-        delay = self.BASE_DELAY * (self.BACKOFF_MULTIPLIER**self._retry_count)
-        delay = min(delay, self.MAX_DELAY)
-
-        # Add jitter: randomize between 50% and 100% of calculated delay
-        jitter = random.uniform(0.5, 1.0)
-        return delay * jitter
+        # Add jitter: randomize between 50% and 100% of the scheduled delay
+        return self._delays[self._retry_count] * (random.random() * 0.5 + 0.5)
 
     async def reconnect_with_backoff(
         self,
@@ -162,8 +187,10 @@ class ReconnectionHandler:
                 if self._retry_count > 0:
                     delay = self._calculate_delay()
                     logger.info(
-                        f"Reconnection attempt {self._retry_count + 1}/{self._max_retries} "
-                        f"in {delay:.1f}s..."
+                        "Reconnection attempt %d/%d in %.1fs...",
+                        self._retry_count + 1,
+                        self._max_retries,
+                        delay,
                     )
 
                     # Call retry callback if provided
@@ -185,24 +212,30 @@ class ReconnectionHandler:
 
             except GeminiAuthenticationError as e:
                 # Authentication errors are not transient - fail immediately
-                logger.error(f"Authentication failed: {e}")
+                logger.error("Authentication failed: %s", e)
                 self._state = ReconnectionState.FAILED
                 return False
 
-            except (GeminiConnectionError, GeminiAudioError, Exception) as e:
+            except self._TRANSIENT_ERRORS as e:
                 # Transient errors - retry with backoff
                 self._retry_count += 1
                 logger.warning(
-                    f"Connection attempt {self._retry_count} failed: {e}"
+                    "Connection attempt %d failed: %s", self._retry_count, e
                 )
 
                 if self._retry_count >= self._max_retries:
                     logger.error(
-                        f"Max retries ({self._max_retries}) exceeded. Giving up."
+                        "Max retries (%d) exceeded. Giving up.", self._max_retries
                     )
                     self._state = ReconnectionState.FAILED
                     return False
 
+            except Exception as e:
+                # Unexpected errors are not transient - fail fast without retrying
+                logger.error("Unexpected error during connection attempt: %s", e)
+                self._state = ReconnectionState.FAILED
+                return False
+
         # Should not reach here, but just in case
         self._state = ReconnectionState.FAILED
         return False
@@ -227,16 +260,20 @@ class SessionTimeoutTracker:
             session_timeout: Session timeout in seconds (default 10 minutes)
         """
         self._session_timeout = session_timeout
+        self._timeout_threshold = session_timeout - self.RECONNECT_BUFFER
         self._session_start_time: Optional[float] = None
+        self._deadline: Optional[float] = None
 
     def start_session(self) -> None:
         """Mark the start of a new session."""
-        self._session_start_time = asyncio.get_running_loop().time()
+        self._session_start_time = time.monotonic()
+        self._deadline = self._session_start_time + self._timeout_threshold
         logger.debug("Session timeout tracking started")
 
     def end_session(self) -> None:
         """Mark the end of the current session."""
         self._session_start_time = None
+        self._deadline = None
         logger.debug("Session timeout tracking ended")
 
     def get_session_duration(self) -> float:
@@ -249,7 +286,7 @@ class SessionTimeoutTracker:
         if self._session_start_time is None:
             return 0.0
 
-        current_time = asyncio.get_running_loop().time()
+        current_time = time.monotonic()
         return current_time - self._session_start_time
 
     def should_reconnect(self) -> bool:
@@ -259,20 +296,16 @@ class SessionTimeoutTracker:
         Returns:
             True if session is approaching timeout, False otherwise
         """
-        if self._session_start_time is None:
+        if self._deadline is None or time.monotonic() < self._deadline:
             return False
 
-        duration = self.get_session_duration()
-        timeout_threshold = self._session_timeout - self.RECONNECT_BUFFER
-
-        if duration >= timeout_threshold:
-            logger.warning(
-                f"Session approaching timeout ({duration:.1f}s / {self._session_timeout:.1f}s). "
-                "Proactive reconnection recommended."
-            )
-            return True
-
-        return False
+        logger.warning(
+            "Session approaching timeout (%.1fs / %.1fs). "
+            "Proactive reconnection recommended.",
+            self.get_session_duration(),
+            self._session_timeout,
+        )
+        return True
 
     def time_until_reconnect(self) -> float:
         """
@@ -281,9 +314,7 @@ class SessionTimeoutTracker:
         Returns:
             Seconds until reconnection needed, or -1.0 if already past threshold
         """
-        if self._session_start_time is None:
+        if self._deadline is None:
             return float("inf")
 
-        duration = self.get_session_duration()
-        timeout_threshold = self._session_timeout - self.RECONNECT_BUFFER
-        return max(0.0, timeout_threshold - duration)
+        return max(0.0, self._deadline - time.monotonic())
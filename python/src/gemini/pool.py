@@ -0,0 +1,137 @@
+"""
+Gemini client pool module.
+
+Keeps connected Gemini clients alive between pipeline restarts so that
+switching modes does not pay the TLS and Live API handshake again.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from .client import GeminiS2STClient
+from .config import GeminiConfig, SupportedLanguage
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[SupportedLanguage, str]
+
+
+class GeminiClientPool:
+    """
+    Pool of connected Gemini clients keyed by (target_language, model).
+
+    Released clients stay connected for up to idle_timeout seconds and are
+    handed out again by acquire(); stale or disconnected clients are closed
+    instead of being reused.
+
+    Example:
+        ```python
+        pool = GeminiClientPool()
+        client = await pool.acquire(config)
+        try:
+            await client.send_audio(chunk)
+        finally:
+            await pool.release(client)
+        ```
+    """
+
+    def __init__(self, max_idle_per_key: int = 2, idle_timeout: float = 60.0):
+        """
+        Initialize client pool.
+
+        Args:
+            max_idle_per_key: Maximum idle clients kept for each key
+            idle_timeout: Seconds an idle client is kept before being closed
+        """
+        self._max_idle_per_key = max_idle_per_key
+        self._idle_timeout = idle_timeout
+        self._idle: dict[PoolKey, list[tuple[GeminiS2STClient, float]]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(config: GeminiConfig) -> PoolKey:
+        """Build the pool key for a configuration."""
+        return (config.target_language, config.model)
+
+    @property
+    def idle_count(self) -> int:
+        """Get the number of idle clients held by the pool."""
+        return sum(len(entries) for entries in self._idle.values())
+
+    async def acquire(self, config: GeminiConfig) -> GeminiS2STClient:
+        """
+        Get a connected client for the given configuration.
+
+        Reuses an idle client with the same target language and model when
+        one is available, otherwise creates and connects a new one.
+
+        Args:
+            config: Gemini configuration
+
+        Returns:
+            Connected Gemini client
+
+        Raises:
+            GeminiConnectionError: If a new client fails to connect
+        """
+        key = self._key(config)
+        stale: list[GeminiS2STClient] = []
+        client: Optional[GeminiS2STClient] = None
+
+        async with self._lock:
+            entries = self._idle.get(key, [])
+            now = time.monotonic()
+            while entries:
+                candidate, released_at = entries.pop()
+                if candidate.is_connected and now - released_at < self._idle_timeout:
+                    client = candidate
+                    break
+                stale.append(candidate)
+
+        for old in stale:
+            await old.disconnect()
+
+        if client is not None:
+            logger.debug("Reusing pooled Gemini client for %s", key[0].name)
+            return client
+
+        client = GeminiS2STClient(config=config)
+        await client.connect()
+        return client
+
+    async def release(self, client: GeminiS2STClient) -> None:
+        """
+        Return a client to the pool, or disconnect it if it cannot be reused.
+
+        Args:
+            client: Client previously obtained from acquire()
+        """
+        if not client.is_connected:
+            await client.disconnect()
+            return
+
+        client.clear_receive_queue()
+        client.clear_transcriptions()
+
+        key = self._key(client.config)
+        evicted: Optional[GeminiS2STClient] = None
+
+        async with self._lock:
+            entries = self._idle.setdefault(key, [])
+            entries.append((client, time.monotonic()))
+            if len(entries) > self._max_idle_per_key:
+                evicted, _ = entries.pop(0)
+
+        if evicted is not None:
+            await evicted.disconnect()
+
+    async def close_all(self) -> None:
+        """Disconnect every idle client held by the pool."""
+        async with self._lock:
+            clients = [client for entries in self._idle.values() for client, _ in entries]
+            self._idle.clear()
+
+        for client in clients:
+            await client.disconnect()
@@ -8,8 +8,8 @@ coordinates the translation services.
 
 import asyncio
 import logging
+import signal
 import sys
-from typing import NoReturn
 
 # Configure logging
 logging.basicConfig(
@@ -21,14 +21,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main() -> NoReturn:
+async def main() -> None:
     """
     Main application entry point.
 
-    Sets up the IPC server and starts the event loop.
+    Sets up the IPC server and runs until SIGINT/SIGTERM is received.
     """
     logger.info("Starting Zoom S2S Translator backend v0.1.0")
 
+    shutdown = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown.set)
+        except NotImplementedError:
+            # Windows: SIGINT still surfaces as KeyboardInterrupt
+            pass
+
     try:
         # TODO: Initialize IPC server
         # TODO: Initialize audio subsystem
@@ -36,9 +45,9 @@ async def main() -> NoReturn:
 
         logger.info("Backend initialized successfully")
 
-        # Keep the event loop running
-        while True:
-            await asyncio.sleep(1)
+        # Sleep until a shutdown signal arrives
+        await shutdown.wait()
+        logger.info("Received shutdown signal")
 
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
@@ -50,4 +59,9 @@ async def main() -> NoReturn:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: lower-overhead event loop (not on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -11,6 +11,7 @@ from .pipeline import (
     PipelineState,
     PipelineStats,
     TranslationPipelineError,
+    close_client_pool,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "PipelineState",
     "PipelineStats",
     "TranslationPipelineError",
+    "close_client_pool",
 ]
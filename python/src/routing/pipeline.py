@@ -7,20 +7,23 @@ and Gemini Live API.
 
 import asyncio
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional, Union
 from enum import Enum, auto
 from dataclasses import dataclass
 
 from audio import (
+    AudioDevice,
     MicrophoneCapture,
     SystemAudioCapture,
     SpeakerOutput,
     VirtualMicOutput,
     AudioCaptureError,
+    AudioStreamError,
     AudioPlaybackError,
     find_virtual_mic_device,
     find_loopback_device,
-    resample_audio,
+    StreamingResampler,
     SAMPLE_RATE_SYSTEM,
     BIT_DEPTH,
     CHANNELS,
@@ -30,10 +33,19 @@ from gemini import (
     GeminiConfig,
     SupportedLanguage,
     GeminiConnectionError,
+    GeminiClientPool,
 )
 
 logger = logging.getLogger(__name__)
 
+# Connected clients shared across pipeline restarts and mode switches
+_GEMINI_CLIENT_POOL = GeminiClientPool()
+
+
+async def close_client_pool() -> None:
+    """Disconnect idle pooled Gemini clients (call once on application shutdown)."""
+    await _GEMINI_CLIENT_POOL.close_all()
+
 
 class PipelineMode(Enum):
     """Translation pipeline operating mode."""
@@ -59,8 +71,10 @@ class PipelineStats:
 
     audio_chunks_captured: int = 0
     audio_chunks_sent_to_gemini: int = 0
+    gemini_sends: int = 0  # WebSocket sends; each carries one or more chunks
     audio_chunks_received_from_gemini: int = 0
     audio_chunks_played: int = 0
+    audio_chunks_dropped: int = 0
     errors_encountered: int = 0
     current_mode: Optional[PipelineMode] = None
 
@@ -95,6 +109,12 @@ class TranslationPipeline:
         ```
     """
 
+    # Send coalescing: target batch size (ms of 16kHz audio) and max wait (s)
+    SEND_BATCH_MS: int = 100
+    SEND_MAX_DELAY: float = 0.080
+    # Longest wait for capture audio before re-checking that capture is running
+    IDLE_READ_TIMEOUT: float = 1.0
+
     def __init__(
         self,
         config: GeminiConfig,
@@ -127,6 +147,10 @@ class TranslationPipeline:
         self._virtual_mic_device_index = virtual_mic_device_index
         self._system_audio_device_index = system_audio_device_index
 
+        # Auto-detected devices, reused across restarts until invalidated
+        self._cached_virtual_mic: Optional[AudioDevice] = None
+        self._cached_loopback: Optional[AudioDevice] = None
+
         # Gemini clients (separate for bidirectional to prevent audio mixing)
         self._gemini_client: Optional[GeminiS2STClient] = None  # Used for single-mode
         self._outgoing_gemini_client: Optional[GeminiS2STClient] = None  # For bidirectional outgoing
@@ -136,11 +160,24 @@ class TranslationPipeline:
         self._state = PipelineState.STOPPED
         self._current_mode: Optional[PipelineMode] = None
 
-        # Background tasks
-        self._outgoing_send_task: Optional[asyncio.Task] = None
-        self._outgoing_receive_task: Optional[asyncio.Task] = None
-        self._incoming_send_task: Optional[asyncio.Task] = None
-        self._incoming_receive_task: Optional[asyncio.Task] = None
+        # Background tasks per direction (completed tasks remove themselves)
+        self._outgoing_tasks: set[asyncio.Task] = set()
+        self._incoming_tasks: set[asyncio.Task] = set()
+
+        # Loop failures are signalled here; the supervisor task stops the pipeline
+        self._error_event = asyncio.Event()
+        self._last_error: Optional[BaseException] = None
+        self._supervisor_task: Optional[asyncio.Task] = None
+
+        # Persistent 24kHz -> 16kHz resampler for system audio sent to Gemini
+        self._incoming_resampler = StreamingResampler(
+            original_rate=SAMPLE_RATE_SYSTEM,
+            target_rate=GeminiS2STClient.INPUT_SAMPLE_RATE,
+            channels=CHANNELS,
+        )
+        # Runs send-path transforms (resampling) off the event-loop thread;
+        # a single worker keeps the stateful resampler's calls in order
+        self._resample_executor: Optional[ThreadPoolExecutor] = None
 
         # Statistics
         self._stats = PipelineStats()
@@ -155,6 +192,11 @@ class TranslationPipeline:
         """Get current pipeline state."""
         return self._state
 
+    @property
+    def last_error(self) -> Optional[BaseException]:
+        """Get the error that caused the last automatic stop, if any."""
+        return self._last_error
+
     @property
     def mode(self) -> Optional[PipelineMode]:
         """Get current operating mode."""
@@ -173,8 +215,10 @@ class TranslationPipeline:
             "mode": self._current_mode.name if self._current_mode else None,
             "audio_chunks_captured": self._stats.audio_chunks_captured,
             "audio_chunks_sent_to_gemini": self._stats.audio_chunks_sent_to_gemini,
+            "gemini_sends": self._stats.gemini_sends,
             "audio_chunks_received_from_gemini": self._stats.audio_chunks_received_from_gemini,
             "audio_chunks_played": self._stats.audio_chunks_played,
+            "audio_chunks_dropped": self._stats.audio_chunks_dropped,
             "errors_encountered": self._stats.errors_encountered,
         }
 
@@ -192,20 +236,17 @@ class TranslationPipeline:
     async def _initialize_gemini_client(self) -> None:
         """Initialize and connect single Gemini client (for outgoing or incoming mode)."""
         if self._gemini_client is None:
-            self._gemini_client = GeminiS2STClient(config=self._config)
-            await self._gemini_client.connect()
+            self._gemini_client = await _GEMINI_CLIENT_POOL.acquire(self._config)
             logger.info("Gemini client connected")
 
     async def _initialize_bidirectional_clients(self) -> None:
         """Initialize and connect separate Gemini clients for bidirectional mode."""
         if self._outgoing_gemini_client is None:
-            self._outgoing_gemini_client = GeminiS2STClient(config=self._config)
-            await self._outgoing_gemini_client.connect()
+            self._outgoing_gemini_client = await _GEMINI_CLIENT_POOL.acquire(self._config)
             logger.info("Outgoing Gemini client connected")
 
         if self._incoming_gemini_client is None:
-            self._incoming_gemini_client = GeminiS2STClient(config=self._config)
-            await self._incoming_gemini_client.connect()
+            self._incoming_gemini_client = await _GEMINI_CLIENT_POOL.acquire(self._config)
             logger.info("Incoming Gemini client connected")
 
     async def _run_outgoing_pipeline(self, gemini_client: Optional[GeminiS2STClient] = None) -> None:
@@ -228,7 +269,9 @@ class TranslationPipeline:
         # Auto-detect device if not specified
         virtual_mic_index = self._virtual_mic_device_index
         if virtual_mic_index is None:
-            virtual_mic_device = find_virtual_mic_device()
+            if self._cached_virtual_mic is None:
+                self._cached_virtual_mic = find_virtual_mic_device()
+            virtual_mic_device = self._cached_virtual_mic
             if virtual_mic_device is None:
                 raise TranslationPipelineError(
                     "Virtual microphone device not found. "
@@ -245,12 +288,8 @@ class TranslationPipeline:
         logger.info("Virtual microphone output started")
 
         # Start send and receive loops
-        self._outgoing_send_task = asyncio.create_task(
-            self._outgoing_send_loop(gemini_client)
-        )
-        self._outgoing_receive_task = asyncio.create_task(
-            self._outgoing_receive_loop(gemini_client)
-        )
+        self._spawn(self._outgoing_send_loop(gemini_client), self._outgoing_tasks)
+        self._spawn(self._outgoing_receive_loop(gemini_client), self._outgoing_tasks)
 
     async def start_outgoing(self) -> None:
         """
@@ -276,15 +315,135 @@ class TranslationPipeline:
             await self._run_outgoing_pipeline()
 
             self._state = PipelineState.RUNNING
+            self._start_supervisor()
             logger.info("Outgoing translation pipeline running")
 
         except Exception as e:
             self._state = PipelineState.ERROR
             self._stats.errors_encountered += 1
             logger.error(f"Failed to start outgoing pipeline: {e}")
+            self.invalidate_device_cache()
             await self._cleanup_outgoing()
             raise TranslationPipelineError(f"Failed to start outgoing pipeline: {e}")
 
+    async def _send_captured_audio(
+        self,
+        capture: Union[MicrophoneCapture, SystemAudioCapture],
+        client: GeminiS2STClient,
+        transform: Optional[Callable[[bytes], bytes]] = None,
+    ) -> None:
+        """
+        Forward captured audio to Gemini, coalescing chunks into larger sends.
+
+        Chunks are buffered until SEND_BATCH_MS of 16kHz audio is pending or
+        the oldest buffered chunk has waited SEND_MAX_DELAY seconds, which cuts
+        the number of WebSocket frames for a bounded amount of added latency.
+
+        Args:
+            capture: Running capture device to read from
+            client: Connected Gemini client to send to
+            transform: Optional per-chunk conversion applied before buffering,
+                run on the resample executor so it does not block the event loop
+        """
+        # Bind per-call constants and attribute lookups once, outside the loop
+        loop = asyncio.get_running_loop()
+        now = loop.time
+        executor = self._resample_executor
+        read_chunk = capture.read_chunk
+        send_audio = client.send_audio
+        stats = self._stats
+        max_delay = self.SEND_MAX_DELAY
+        batch_bytes = (
+            GeminiS2STClient.INPUT_SAMPLE_RATE * (BIT_DEPTH // 8) * self.SEND_BATCH_MS
+        ) // 1000
+        buffer = bytearray()
+        buffered_chunks = 0
+        deadline = 0.0
+
+        async def flush() -> None:
+            nonlocal buffered_chunks
+            await send_audio(bytes(buffer))
+            buffer.clear()
+            stats.audio_chunks_sent_to_gemini += buffered_chunks
+            stats.gemini_sends += 1
+            buffered_chunks = 0
+
+        while capture.is_running:
+            # Bounded wait even when idle so a stopped capture is noticed
+            if buffer:
+                timeout = max(deadline - now(), 0.001)
+            else:
+                timeout = self.IDLE_READ_TIMEOUT
+            try:
+                audio_chunk = await read_chunk(timeout=timeout)
+            except asyncio.TimeoutError:
+                audio_chunk = None
+            except AudioStreamError:
+                # Capture stopped between the is_running check and the read
+                break
+            else:
+                data = audio_chunk.data
+                if transform is not None:
+                    data = await loop.run_in_executor(executor, transform, data)
+                if not buffer:
+                    deadline = now() + max_delay
+                buffer += data
+                buffered_chunks += 1
+                stats.audio_chunks_captured += 1
+
+            if buffer and (audio_chunk is None or len(buffer) >= batch_bytes):
+                await flush()
+
+        # Don't drop the tail of the last batch when capture ends
+        if buffer:
+            await flush()
+
+    async def _relay_received_audio(
+        self,
+        client: GeminiS2STClient,
+        output: Union[VirtualMicOutput, SpeakerOutput],
+    ) -> None:
+        """
+        Forward translated audio to an output through a bounded jitter buffer.
+
+        A receive stage moves chunks from Gemini into a queue of
+        config.jitter_buffer_chunks entries, dropping the oldest chunk when
+        the output falls behind, while a write stage drains the queue into
+        the output device. This bounds the latency an output stall can add.
+
+        Args:
+            client: Connected Gemini client to receive from
+            output: Running output device to write to
+        """
+        jitter_buffer: asyncio.Queue[Optional[bytes]] = asyncio.Queue(
+            maxsize=self._config.jitter_buffer_chunks
+        )
+        stats = self._stats
+
+        def enqueue(item: Optional[bytes]) -> None:
+            try:
+                jitter_buffer.put_nowait(item)
+            except asyncio.QueueFull:
+                jitter_buffer.get_nowait()
+                jitter_buffer.put_nowait(item)
+                stats.audio_chunks_dropped += 1
+                logger.warning("Jitter buffer full, dropped oldest audio chunk")
+
+        async def receive_stage() -> None:
+            while chunks := await client.receive_audio_batch():
+                for audio_chunk in chunks:
+                    enqueue(audio_chunk)
+                stats.audio_chunks_received_from_gemini += len(chunks)
+            # Tell the write stage the stream has ended
+            enqueue(None)
+
+        async def write_stage() -> None:
+            while (audio_chunk := await jitter_buffer.get()) is not None:
+                await output.write_chunk(audio_chunk)
+                stats.audio_chunks_played += 1
+
+        await self._run_concurrently(receive_stage(), write_stage())
+
     async def _outgoing_send_loop(self, gemini_client: Optional[GeminiS2STClient] = None) -> None:
         """
         Send loop: Microphone -> Gemini API.
@@ -294,19 +453,14 @@ class TranslationPipeline:
         """
         client = gemini_client or self._gemini_client
         try:
-            async for audio_chunk in self._mic_capture.stream():
-                # Send to Gemini
-                await client.send_audio(audio_chunk.data)
-                self._stats.audio_chunks_captured += 1
-                self._stats.audio_chunks_sent_to_gemini += 1
+            await self._send_captured_audio(self._mic_capture, client)
 
         except asyncio.CancelledError:
             logger.debug("Outgoing send loop cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in outgoing send loop: {e}")
-            self._stats.errors_encountered += 1
-            self._state = PipelineState.ERROR
+            logger.error("Error in outgoing send loop: %s", e)
+            self._signal_error(e)
 
     async def _outgoing_receive_loop(self, gemini_client: Optional[GeminiS2STClient] = None) -> None:
         """
@@ -317,19 +471,14 @@ class TranslationPipeline:
         """
         client = gemini_client or self._gemini_client
         try:
-            async for audio_chunk in client.receive_audio():
-                # Play to virtual mic
-                await self._virtual_mic_output.write_chunk(audio_chunk)
-                self._stats.audio_chunks_received_from_gemini += 1
-                self._stats.audio_chunks_played += 1
+            await self._relay_received_audio(client, self._virtual_mic_output)
 
         except asyncio.CancelledError:
             logger.debug("Outgoing receive loop cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in outgoing receive loop: {e}")
-            self._stats.errors_encountered += 1
-            self._state = PipelineState.ERROR
+            logger.error("Error in outgoing receive loop: %s", e)
+            self._signal_error(e)
 
     async def _run_incoming_pipeline(self, gemini_client: Optional[GeminiS2STClient] = None) -> None:
         """
@@ -344,7 +493,9 @@ class TranslationPipeline:
         # Auto-detect device if not specified
         system_audio_index = self._system_audio_device_index
         if system_audio_index is None:
-            loopback_device = find_loopback_device()
+            if self._cached_loopback is None:
+                self._cached_loopback = find_loopback_device()
+            loopback_device = self._cached_loopback
             if loopback_device is None:
                 raise TranslationPipelineError(
                     "System audio loopback device not found. "
@@ -367,13 +518,14 @@ class TranslationPipeline:
         await self._speaker_output.start()
         logger.info("Speaker output started")
 
+        if self._resample_executor is None:
+            self._resample_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="resample"
+            )
+
         # Start send and receive loops
-        self._incoming_send_task = asyncio.create_task(
-            self._incoming_send_loop(gemini_client)
-        )
-        self._incoming_receive_task = asyncio.create_task(
-            self._incoming_receive_loop(gemini_client)
-        )
+        self._spawn(self._incoming_send_loop(gemini_client), self._incoming_tasks)
+        self._spawn(self._incoming_receive_loop(gemini_client), self._incoming_tasks)
 
     async def start_incoming(self) -> None:
         """
@@ -399,12 +551,14 @@ class TranslationPipeline:
             await self._run_incoming_pipeline()
 
             self._state = PipelineState.RUNNING
+            self._start_supervisor()
             logger.info("Incoming translation pipeline running")
 
         except Exception as e:
             self._state = PipelineState.ERROR
             self._stats.errors_encountered += 1
             logger.error(f"Failed to start incoming pipeline: {e}")
+            self.invalidate_device_cache()
             await self._cleanup_incoming()
             raise TranslationPipelineError(f"Failed to start incoming pipeline: {e}")
 
@@ -419,29 +573,19 @@ class TranslationPipeline:
         """
         client = gemini_client or self._gemini_client
         try:
-            async for audio_chunk in self._system_capture.stream():
-                # Resample from 24kHz to 16kHz for Gemini
-                # System audio is 24kHz but Gemini expects 16kHz input
-                resampled_data = resample_audio(
-                    audio_chunk.data,
-                    original_rate=SAMPLE_RATE_SYSTEM,  # 24kHz
-                    target_rate=GeminiS2STClient.INPUT_SAMPLE_RATE,  # 16kHz
-                    channels=CHANNELS,
-                    bit_depth=BIT_DEPTH,
-                )
-
-                # Send to Gemini
-                await client.send_audio(resampled_data)
-                self._stats.audio_chunks_captured += 1
-                self._stats.audio_chunks_sent_to_gemini += 1
+            # System audio is 24kHz but Gemini expects 16kHz input
+            await self._send_captured_audio(
+                self._system_capture,
+                client,
+                transform=self._incoming_resampler.resample_chunk,
+            )
 
         except asyncio.CancelledError:
             logger.debug("Incoming send loop cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in incoming send loop: {e}")
-            self._stats.errors_encountered += 1
-            self._state = PipelineState.ERROR
+            logger.error("Error in incoming send loop: %s", e)
+            self._signal_error(e)
 
     async def _incoming_receive_loop(self, gemini_client: Optional[GeminiS2STClient] = None) -> None:
         """
@@ -452,19 +596,14 @@ class TranslationPipeline:
         """
         client = gemini_client or self._gemini_client
         try:
-            async for audio_chunk in client.receive_audio():
-                # Play to speakers
-                await self._speaker_output.write_chunk(audio_chunk)
-                self._stats.audio_chunks_received_from_gemini += 1
-                self._stats.audio_chunks_played += 1
+            await self._relay_received_audio(client, self._speaker_output)
 
         except asyncio.CancelledError:
             logger.debug("Incoming receive loop cancelled")
             raise
         except Exception as e:
-            logger.error(f"Error in incoming receive loop: {e}")
-            self._stats.errors_encountered += 1
-            self._state = PipelineState.ERROR
+            logger.error("Error in incoming receive loop: %s", e)
+            self._signal_error(e)
 
     async def start_bidirectional(self) -> None:
         """
@@ -488,39 +627,118 @@ class TranslationPipeline:
             await self._initialize_bidirectional_clients()
 
             # Run both pipelines concurrently using separate clients
-            await asyncio.gather(
+            await self._run_concurrently(
                 self._run_outgoing_pipeline(self._outgoing_gemini_client),
-                self._run_incoming_pipeline(self._incoming_gemini_client)
+                self._run_incoming_pipeline(self._incoming_gemini_client),
             )
 
             self._state = PipelineState.RUNNING
+            self._start_supervisor()
             logger.info("Bidirectional translation pipeline running")
 
         except Exception as e:
             self._state = PipelineState.ERROR
             self._stats.errors_encountered += 1
             logger.error(f"Failed to start bidirectional pipeline: {e}")
+            self.invalidate_device_cache()
             await self.stop()
             raise TranslationPipelineError(
                 f"Failed to start bidirectional pipeline: {e}"
             )
 
+    def _signal_error(self, error: BaseException) -> None:
+        """
+        Record a streaming loop failure and wake the supervisor.
+
+        Args:
+            error: Exception raised by the loop
+        """
+        self._stats.errors_encountered += 1
+        self._last_error = error
+        self._error_event.set()
+
+    def _start_supervisor(self) -> None:
+        """Start the task that stops the pipeline when a loop fails."""
+        self._error_event.clear()
+        self._last_error = None
+        self._supervisor_task = asyncio.create_task(self._supervisor())
+
+    async def _supervisor(self) -> None:
+        """Wait for a loop failure, then stop the whole pipeline."""
+        await self._error_event.wait()
+        logger.error("Stopping pipeline after loop failure: %s", self._last_error)
+        self._state = PipelineState.ERROR
+        await self.stop()
+
+    def invalidate_device_cache(self) -> None:
+        """
+        Forget auto-detected devices so the next start re-scans.
+
+        Called automatically when a pipeline fails to start; call it manually
+        after audio devices are added or removed.
+        """
+        self._cached_virtual_mic = None
+        self._cached_loopback = None
+
+    @staticmethod
+    def _spawn(coro: Coroutine[Any, Any, None], tasks: set[asyncio.Task]) -> asyncio.Task:
+        """
+        Start a background task and track it until it completes.
+
+        Args:
+            coro: Coroutine to run
+            tasks: Set holding the task; the task discards itself when done
+
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    @staticmethod
+    async def _cancel_all(tasks: set[asyncio.Task]) -> None:
+        """
+        Cancel tracked tasks and wait for them to finish.
+
+        Args:
+            tasks: Set of tasks created by _spawn()
+        """
+        pending = list(tasks)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        tasks.clear()
+
+    @staticmethod
+    async def _run_concurrently(*coros: Coroutine[Any, Any, None]) -> None:
+        """
+        Run coroutines concurrently with TaskGroup-style failure handling.
+
+        On the first failure the remaining coroutines are cancelled and awaited
+        before the error is re-raised, so no startup task outlives the call.
+        (asyncio.TaskGroup requires Python 3.11; this backend supports 3.10.)
+
+        Args:
+            coros: Coroutines to run
+        """
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
     async def _cleanup_outgoing(self) -> None:
         """Clean up outgoing pipeline resources."""
         # Cancel tasks
-        if self._outgoing_send_task and not self._outgoing_send_task.done():
-            self._outgoing_send_task.cancel()
-            try:
-                await self._outgoing_send_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._outgoing_receive_task and not self._outgoing_receive_task.done():
-            self._outgoing_receive_task.cancel()
-            try:
-                await self._outgoing_receive_task
-            except asyncio.CancelledError:
-                pass
+        await self._cancel_all(self._outgoing_tasks)
 
         # Stop audio devices
         if self._mic_capture:
@@ -534,19 +752,7 @@ class TranslationPipeline:
     async def _cleanup_incoming(self) -> None:
         """Clean up incoming pipeline resources."""
         # Cancel tasks
-        if self._incoming_send_task and not self._incoming_send_task.done():
-            self._incoming_send_task.cancel()
-            try:
-                await self._incoming_send_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._incoming_receive_task and not self._incoming_receive_task.done():
-            self._incoming_receive_task.cancel()
-            try:
-                await self._incoming_receive_task
-            except asyncio.CancelledError:
-                pass
+        await self._cancel_all(self._incoming_tasks)
 
         # Stop audio devices
         if self._system_capture:
@@ -557,6 +763,28 @@ class TranslationPipeline:
             await self._speaker_output.stop()
             self._speaker_output = None
 
+        # Let any in-flight resample finish before touching resampler state
+        if self._resample_executor is not None:
+            executor, self._resample_executor = self._resample_executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+        # Drop resampler state so a restart doesn't splice in stale audio
+        self._incoming_resampler.reset()
+
+    @staticmethod
+    async def _release_gemini_client(client: GeminiS2STClient, errored: bool) -> None:
+        """
+        Hand a Gemini client back to the shared pool.
+
+        Args:
+            client: Client to release
+            errored: Disconnect instead of pooling (pipeline ended in error)
+        """
+        if errored:
+            await client.disconnect()
+        else:
+            await _GEMINI_CLIENT_POOL.release(client)
+
     async def stop(self) -> None:
         """
         Stop the translation pipeline and clean up all resources.
@@ -564,9 +792,19 @@ class TranslationPipeline:
         if self._state == PipelineState.STOPPED:
             return
 
+        errored = self._state == PipelineState.ERROR
         self._state = PipelineState.STOPPING
         logger.info("Stopping translation pipeline")
 
+        supervisor = self._supervisor_task
+        self._supervisor_task = None
+        if supervisor and supervisor is not asyncio.current_task() and not supervisor.done():
+            supervisor.cancel()
+            try:
+                await supervisor
+            except asyncio.CancelledError:
+                pass
+
         try:
             # Clean up based on mode
             if self._current_mode in (
@@ -581,17 +819,17 @@ class TranslationPipeline:
             ):
                 await self._cleanup_incoming()
 
-            # Disconnect Gemini client(s)
+            # Return Gemini client(s) to the pool, or disconnect after errors
             if self._gemini_client:
-                await self._gemini_client.disconnect()
+                await self._release_gemini_client(self._gemini_client, errored)
                 self._gemini_client = None
 
             if self._outgoing_gemini_client:
-                await self._outgoing_gemini_client.disconnect()
+                await self._release_gemini_client(self._outgoing_gemini_client, errored)
                 self._outgoing_gemini_client = None
 
             if self._incoming_gemini_client:
-                await self._incoming_gemini_client.disconnect()
+                await self._release_gemini_client(self._incoming_gemini_client, errored)
                 self._incoming_gemini_client = None
 
             self._state = PipelineState.STOPPED
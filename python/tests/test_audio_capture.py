@@ -433,6 +433,7 @@ class TestBaseCaptureDevice:
             time_info,
             0,  # No status flags
         )
+        device._loop.run_until_complete(asyncio.sleep(0))  # Run queued hand-off
 
         assert result == (None, mock_pyaudio.paContinue)
         assert device._chunks_captured == 1
@@ -470,15 +471,36 @@ class TestBaseCaptureDevice:
 
         # Fill the queue
         device._audio_callback(sample_audio_data, CHUNK_SIZE, time_info, 0)
+        device._loop.run_until_complete(asyncio.sleep(0))
         assert device._queue.qsize() == 1
 
-        # This should not raise, just increment overruns
+        # This should not raise, just drop the oldest chunk and count an overrun
         device._audio_callback(sample_audio_data, CHUNK_SIZE, time_info, 0)
+        device._loop.run_until_complete(asyncio.sleep(0))
         assert device._overruns == 1
         assert device._queue.qsize() == 1  # Queue still has just 1 item
 
         device._loop.close()
 
+    def test_audio_callback_queue_full_drops_oldest(
+        self, mock_pyaudio, sample_audio_data
+    ):
+        """Test a full queue keeps the newest chunks."""
+        device = BaseCaptureDevice(sample_rate=16000)
+        device._loop = asyncio.new_event_loop()
+        device._queue = asyncio.Queue(maxsize=2)
+
+        for i in range(3):
+            time_info = {"input_buffer_adc_time": float(i)}
+            device._audio_callback(sample_audio_data, CHUNK_SIZE, time_info, 0)
+        device._loop.run_until_complete(asyncio.sleep(0))
+
+        timestamps = [device._queue.get_nowait().timestamp for _ in range(2)]
+        assert timestamps == [1.0, 2.0]
+        assert device._overruns == 1
+
+        device._loop.close()
+
     @pytest.mark.asyncio
     async def test_audio_callback_invokes_on_data(self, mock_pyaudio, sample_audio_data):
         """Test audio callback invokes on_data callback."""
@@ -627,6 +649,7 @@ class TestSystemAudioCapture:
 
         # Process stereo audio through callback
         capture._audio_callback(stereo_audio_data, CHUNK_SIZE, time_info, 0)
+        capture._loop.run_until_complete(asyncio.sleep(0))
 
         # Get the processed chunk from queue
         chunk = capture._queue.get_nowait()
@@ -648,6 +671,7 @@ class TestSystemAudioCapture:
         time_info = {"input_buffer_adc_time": 0.5}
 
         capture._audio_callback(stereo_audio_data, CHUNK_SIZE, time_info, 0)
+        capture._loop.run_until_complete(asyncio.sleep(0))
 
         chunk = capture._queue.get_nowait()
         assert chunk.frames == CHUNK_SIZE
@@ -662,6 +686,7 @@ class TestSystemAudioCapture:
         time_info = {"input_buffer_adc_time": 0.5}
 
         capture._audio_callback(sample_audio_data, CHUNK_SIZE, time_info, 0)
+        capture._loop.run_until_complete(asyncio.sleep(0))
 
         chunk = capture._queue.get_nowait()
         assert chunk.data == sample_audio_data
@@ -726,6 +751,7 @@ class TestCaptureIntegration:
         # Process 10 chunks
         for _ in range(10):
             device._audio_callback(sample_audio_data, CHUNK_SIZE, time_info, 0)
+        await asyncio.sleep(0)  # Let the queued hand-offs run
 
         stats = device.stats
 
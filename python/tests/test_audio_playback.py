@@ -409,6 +409,23 @@ class TestBasePlaybackDevice:
 
         await device.stop()
 
+    @pytest.mark.asyncio
+    async def test_write_chunk_skips_executor_when_queue_has_room(
+        self, mock_pyaudio, sample_audio_data
+    ):
+        """Test write_chunk enqueues directly without an executor hop."""
+        device = BasePlaybackDevice(sample_rate=24000)
+        await device.start()
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor") as mock_executor:
+            await device.write_chunk(sample_audio_data)
+
+        mock_executor.assert_not_called()
+        assert device._queue.queue[-1] is sample_audio_data
+
+        await device.stop()
+
     @pytest.mark.asyncio
     async def test_write_chunk_not_running_raises_error(
         self, mock_pyaudio, sample_audio_data
@@ -510,6 +527,50 @@ class TestBasePlaybackDevice:
 
         assert device._underruns == 1
 
+    def test_audio_callback_combines_small_chunks(self, mock_pyaudio):
+        """Test audio callback concatenates small chunks into one buffer."""
+        device = BasePlaybackDevice(sample_rate=24000)
+        device._state = PlaybackState.RUNNING
+        half = CHUNK_SIZE * CHANNELS * (BIT_DEPTH // 8) // 2
+
+        device._queue.put(b"\x01" * half)
+        device._queue.put(b"\x02" * half)
+
+        result = device._audio_callback(None, CHUNK_SIZE, {}, 0)
+
+        assert result[0] == b"\x01" * half + b"\x02" * half
+        assert device._chunks_played == 2
+        assert device._underruns == 0
+
+    def test_audio_callback_splits_large_chunk(self, mock_pyaudio):
+        """Test audio callback carries the remainder of a large chunk over."""
+        device = BasePlaybackDevice(sample_rate=24000)
+        device._state = PlaybackState.RUNNING
+        chunk_bytes = CHUNK_SIZE * CHANNELS * (BIT_DEPTH // 8)
+
+        device._queue.put(b"\x01" * chunk_bytes + b"\x02" * chunk_bytes)
+
+        first = device._audio_callback(None, CHUNK_SIZE, {}, 0)
+        second = device._audio_callback(None, CHUNK_SIZE, {}, 0)
+
+        assert first[0] == b"\x01" * chunk_bytes
+        assert second[0] == b"\x02" * chunk_bytes
+        assert device._underruns == 0
+
+    def test_audio_callback_pads_short_data_with_silence(self, mock_pyaudio):
+        """Test audio callback pads a partial buffer and counts an underrun."""
+        device = BasePlaybackDevice(sample_rate=24000)
+        device._state = PlaybackState.RUNNING
+
+        device._queue.put(b"\x01\x01")
+
+        result = device._audio_callback(None, CHUNK_SIZE, {}, 0)
+
+        assert len(result[0]) == len(device._silence)
+        assert result[0].startswith(b"\x01\x01")
+        assert result[0][2:] == device._silence[2:]
+        assert device._underruns == 1
+
     def test_audio_callback_exception_handling(self, mock_pyaudio):
         """Test audio callback handles exceptions gracefully."""
         device = BasePlaybackDevice(sample_rate=24000)
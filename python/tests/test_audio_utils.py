@@ -0,0 +1,114 @@
+"""
+Tests for audio utility functions.
+
+Tests StreamingResampler on both the soxr path and the scipy fallback
+using synthetic 16-bit PCM audio.
+"""
+
+from unittest.mock import patch
+import numpy as np
+import pytest
+
+from src.audio import utils
+from src.audio.utils import StreamingResampler
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def tone_chunks():
+    """Ten 1024-sample chunks of a continuous 440Hz tone at 24kHz."""
+    t = np.arange(10 * 1024) / 24000
+    tone = (np.sin(2 * np.pi * 440 * t) * 10000).astype(np.int16)
+    return [chunk.tobytes() for chunk in np.split(tone, 10)]
+
+
+requires_soxr = pytest.mark.skipif(utils.soxr is None, reason="soxr not installed")
+
+
+# ============================================================================
+# StreamingResampler Tests
+# ============================================================================
+
+
+class TestStreamingResampler:
+    """Tests for StreamingResampler."""
+
+    def test_same_rate_passthrough(self):
+        """Test audio is returned unchanged when rates match."""
+        resampler = StreamingResampler(16000, 16000)
+        data = np.arange(1024, dtype=np.int16).tobytes()
+
+        assert resampler.resample_chunk(data) == data
+
+    @requires_soxr
+    def test_soxr_stream_preserves_total_length(self, tone_chunks):
+        """Test streamed output length matches the rate ratio over many chunks."""
+        resampler = StreamingResampler(24000, 16000)
+
+        total = sum(len(resampler.resample_chunk(c)) // 2 for c in tone_chunks)
+
+        # 10240 * 2/3 = 6826.7; soxr holds back only a few filter-delay samples
+        assert 6800 <= total <= 6827
+
+    @requires_soxr
+    def test_soxr_multichannel_keeps_channels_interleaved(self):
+        """Test stereo chunks are resampled per channel and stay interleaved."""
+        resampler = StreamingResampler(24000, 16000, channels=2)
+        stereo = np.empty((2400, 2), dtype=np.int16)
+        stereo[:, 0] = 1000
+        stereo[:, 1] = -1000
+
+        out = np.frombuffer(resampler.resample_chunk(stereo.tobytes()), dtype=np.int16)
+        frames = out.reshape(-1, 2)[200:]  # Skip filter warm-up
+
+        assert out.size % 2 == 0
+        assert np.allclose(frames[:, 0], 1000, atol=20)
+        assert np.allclose(frames[:, 1], -1000, atol=20)
+
+    @requires_soxr
+    def test_reset_discards_buffered_state(self, tone_chunks):
+        """Test reset() makes the next chunk resample like a fresh stream."""
+        fresh = StreamingResampler(24000, 16000)
+        expected = np.frombuffer(fresh.resample_chunk(tone_chunks[0]), dtype=np.int16)
+
+        reused = StreamingResampler(24000, 16000)
+        for chunk in tone_chunks[3:]:
+            reused.resample_chunk(chunk)
+        reused.reset()
+        out = np.frombuffer(reused.resample_chunk(tone_chunks[0]), dtype=np.int16)
+
+        # Without the reset the tail of the previous stream would leak in
+        assert len(out) == len(expected)
+        assert np.allclose(out, expected, atol=4)
+
+    def test_fallback_without_soxr(self, tone_chunks):
+        """Test resample_audio() is used per chunk when soxr is unavailable."""
+        with patch("src.audio.utils.soxr", None):
+            resampler = StreamingResampler(24000, 16000)
+
+        assert resampler._stream is None
+
+        out = resampler.resample_chunk(tone_chunks[0])
+        assert len(out) // 2 == int(1024 * 16000 / 24000)
+
+        resampler.reset()  # No-op without a stream
+
+    def test_fallback_without_soxr_multichannel(self):
+        """Test the fallback resamples interleaved stereo per channel."""
+        stereo = np.empty((1200, 2), dtype=np.int16)
+        stereo[:, 0] = 1000
+        stereo[:, 1] = -1000
+
+        with patch("src.audio.utils.soxr", None):
+            resampler = StreamingResampler(24000, 16000, channels=2)
+
+        out = np.frombuffer(resampler.resample_chunk(stereo.tobytes()), dtype=np.int16)
+        frames = out.reshape(-1, 2)
+
+        assert len(frames) == 800
+        assert np.allclose(frames[:, 0], 1000, atol=20)
+        assert np.allclose(frames[:, 1], -1000, atol=20)